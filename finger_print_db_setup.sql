@@ -17,7 +17,8 @@ CREATE TABLE IF NOT EXISTS access_logs (
     timestamp DATETIME NOT NULL,
     confidence INT,
     status VARCHAR(20) NOT NULL,
-    FOREIGN KEY (fingerprint_id) REFERENCES fingerprints(id) ON DELETE SET NULL
+    FOREIGN KEY (fingerprint_id) REFERENCES fingerprints(id) ON DELETE SET NULL,
+    INDEX idx_access_logs_ts (timestamp DESC)
 );
 
 -- Create a user for the Python application (
@@ -1,15 +1,21 @@
 import sys
+import functools
+import queue
 import time
+import threading
+from collections import deque, namedtuple
+from contextlib import contextmanager
 from datetime import datetime
 from loguru import logger
 import serial
 import mysql.connector
+from mysql.connector import pooling
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QLabel, QLineEdit, QMessageBox, 
                             QTableWidget, QTableWidgetItem, QHeaderView, QFormLayout,
                             QComboBox, QSpinBox, QGroupBox, QStatusBar, QSplitter)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QTimer
-from PyQt5.QtGui import QFont, QIcon, QPixmap
+from PyQt5.QtCore import Qt, QObject, QThread, QThreadPool, QRunnable, pyqtSignal, pyqtSlot, QTimer
+from PyQt5.QtGui import QColor, QFont, QIcon, QPalette, QPixmap
 
 SERIAL_PORT = '/dev/ttyUSB0'  # Change this to your ESP32 serial port in Windows (COM1,COM2,COM3)
 BAUD_RATE = 115200
@@ -19,6 +25,7 @@ DB_CONFIG = {
     'password': '',
     'database': 'fingers'
 }
+DB_POOL_SIZE = 5
 
 # Command definitions
 CMD_ENROLL = 'E'
@@ -30,9 +37,75 @@ CMD_SUCCESS = 'S'
 CMD_FAILURE = 'F'
 CMD_READY = 'Y'
 
+# Wire encoding of each command sent to the ESP32, built once
+CMD_BYTES = {cmd: cmd.encode('ascii') for cmd in (CMD_ENROLL, CMD_VERIFY, CMD_DELETE, CMD_COUNT)}
+# Ends every command, so commands sharing a write can never run together
+CMD_END = b'\n'
+# Commands that change the sensor's template store; a batch holding any of
+# them ends with a count query so the stored-template figure stays current
+MUTATING_COMMANDS = {CMD_ENROLL, CMD_DELETE}
+# Decimal encodings of every ID the sensor can store, for E[id]/D[id]
+PARAM_BYTES = [b"%d" % i for i in range(128)]
+# First byte of every response frame
+RESPONSE_PREFIX = CMD_RESPONSE.encode('ascii')
+
+# Safety-net reload of both tables, for edits made outside this application
+REFRESH_INTERVAL_MS = 60000
+
+# How long EN is held low to reset the ESP32 on connect
+RESET_PULSE_MS = 50
+
+# Batches accepted ahead of the serial worker before flush refuses more
+TX_QUEUE_SIZE = 16
+# Commands sent this close together share one write
+TX_COALESCE_MS = 5
+
+# Repeats of the same database error within this window are counted, not logged
+ERROR_LOG_INTERVAL_S = 10
+
+# IDs per DELETE ... IN (...) statement in a bulk delete
+DELETE_CHUNK_SIZE = 900
+
+# Sensor deletes sent ahead of their acknowledgements. The ESP32 serial
+# receive buffer holds 256 bytes and each delete keeps the firmware busy for
+# 100 ms or more, so the unanswered commands ("D127\n" at most 5 bytes each,
+# plus the trailing count query) must fit in it
+DELETES_IN_FLIGHT = 32
+# A bulk delete is given up on when the sensor stays silent this long
+DELETE_REPLY_TIMEOUT_MS = 5000
+
+# Longest partial line kept while waiting for its newline
+MAX_LINE_LENGTH = 1024
+
+# Buffered access-log rows are written once this many are pending, when the
+# flush timer fires, or straight away for the statuses that must not wait
+LOG_FLUSH_THRESHOLD = 50
+LOG_FLUSH_INTERVAL_MS = 1000
+URGENT_LOG_STATUSES = {"ACCESS_DENIED"}
+# Most rows kept for retry while the database cannot be written; the oldest go first
+LOG_BUFFER_LIMIT = 10000
+
+# Status bar text for the delete flow
+MSG_DELETE_SENSOR_FAILED = "Failed to delete fingerprint from sensor"
+MSG_DELETE_DB_ERROR = "Database error during deletion"
+MSG_DELETE_OK = "Fingerprint ID {} deleted successfully"
+MSG_DELETE_OK_MANY = "{} fingerprints deleted successfully"
+
+Response = namedtuple('Response', 'response type id confidence message')
+
+
+def parse_response(line):
+    """Parse an 'R,type,id,confidence,message' frame, or None if it is malformed"""
+    # At most four splits, so commas inside the message stay in the last part
+    parts = line.split(',', 4)
+    if len(parts) < 5:
+        return None
+    return Response(parts[0], parts[1], int(parts[2]), int(parts[3]), parts[4])
+
+
 class SerialWorker(QThread):
     """Worker thread that handles serial communication"""
-    responseReceived = pyqtSignal(dict)
+    responseReceived = pyqtSignal(object)
     messageReceived = pyqtSignal(str)
     readyChanged = pyqtSignal(bool)
     
@@ -41,13 +114,42 @@ class SerialWorker(QThread):
         self.port = port
         self.baud_rate = baud_rate
         self.ser = None
-        self.running = False
+        # Cleared by request_stop(), possibly before run() has opened the port
+        self.running = True
         self.ready = False
+        # Bytes read from the port that do not yet end in a newline
+        self._rxbuf = bytearray()
+        # Commands from the GUI thread, written out by run()
+        self._tx_q = queue.Queue(maxsize=TX_QUEUE_SIZE)
+        # Framed commands batched on the GUI thread, and their labels for the status bar
+        self._tx_buf = bytearray()
+        self._tx_sent = []
+        self._mutation_in_batch = False
+        # Worker-side buffer for joining several queued batches into one write
+        self._tx_frame = bytearray()
+        self._flush_timer = QTimer(singleShot=True)
+        self._flush_timer.setInterval(TX_COALESCE_MS)
+        self._flush_timer.timeout.connect(self.flush)
         
     def connect_serial(self):
         try:
             self.ser = serial.Serial(self.port, self.baud_rate, timeout=1)
-            time.sleep(2)  
+            # USB-serial adapters hold short packets back for up to 16 ms by
+            # default; where the driver allows it, have it pass bytes on at once
+            try:
+                self.ser.set_low_latency_mode(True)
+            except (AttributeError, ValueError):
+                pass
+            # Restart the ESP32 through its auto-reset circuit (RTS drives EN,
+            # DTR drives IO0 and stays released for a normal boot) so a fresh
+            # READY frame follows whatever state the board was in. No settle
+            # delay: the read loop reports readiness when that frame arrives
+            self.ser.dtr = False
+            self.ser.rts = True
+            self.msleep(RESET_PULSE_MS)
+            self.ser.reset_input_buffer()
+            self._rxbuf.clear()
+            self.ser.rts = False
             return True
         except Exception as e:
             self.messageReceived.emit(f"Serial connection error: {e}")
@@ -56,58 +158,219 @@ class SerialWorker(QThread):
     def run(self):
         if not self.connect_serial():
             return
+        if not self.running:
+            # Stopped while the port was opening, before there was a read to cancel
+            self.ser.close()
+            return
             
-        self.running = True
         while self.running:
-            if self.ser and self.ser.in_waiting > 0:
-                try:
-                    line = self.ser.readline().decode('utf-8').strip()
-                    if line.startswith(CMD_RESPONSE):
-                        parts = line.split(',')
-                        if len(parts) >= 5:
-                            response = {
-                                'response': parts[0],
-                                'type': parts[1],
-                                'id': int(parts[2]),
-                                'confidence': int(parts[3]),
-                                'message': ','.join(parts[4:])
-                            }
-                            self.responseReceived.emit(response)
-                            
-                            if response['type'] == CMD_READY and not self.ready:
-                                self.ready = True
-                                self.readyChanged.emit(True)
-                            elif response['type'] != CMD_READY and self.ready:
-                                self.ready = False
-                                self.readyChanged.emit(False)
-                    else:
-                        self.messageReceived.emit(f"ESP32: {line}")
-                except Exception as e:
-                    self.messageReceived.emit(f"Error parsing response: {e}")
+            try:
+                # Blocks until a byte arrives or the port timeout expires, then
+                # takes everything the driver already holds in one call;
+                # pyserial waits in select() on POSIX, so there is no poll interval
+                chunk = self.ser.read(self.ser.in_waiting or 1)
+            except Exception as e:
+                if self.running:
+                    self.messageReceived.emit(f"Serial read error: {e}")
+                break
+            
+            if self.running:
+                self._drain_commands()
             
-            self.msleep(100)
+            if not chunk:
+                continue
+            
+            rxbuf = self._rxbuf
+            rxbuf += chunk
+            start = 0
+            end = rxbuf.find(b'\n')
+            while end >= 0:
+                self.handle_line(rxbuf[start:end])
+                start = end + 1
+                end = rxbuf.find(b'\n', start)
+            # One compaction per read rather than one per line
+            del rxbuf[:start]
+            if len(rxbuf) > MAX_LINE_LENGTH:
+                rxbuf.clear()
+        
+        self.ser.close()
+    
+    def handle_line(self, frame):
+        """Emit one complete line from the ESP32 as a response or a plain message"""
+        try:
+            # Tell frames apart by their first byte so debug output is decoded
+            # only once, for the message it becomes
+            if frame[:1] == RESPONSE_PREFIX:
+                response = parse_response(frame.decode('ascii').rstrip())
+                if response:
+                    self.responseReceived.emit(response)
+                    
+                    if response.type == CMD_READY and not self.ready:
+                        self.ready = True
+                        self.readyChanged.emit(True)
+                    elif response.type != CMD_READY and self.ready:
+                        self.ready = False
+                        self.readyChanged.emit(False)
+            else:
+                self.messageReceived.emit("ESP32: " + frame.decode('ascii', 'replace').strip())
+        except Exception as e:
+            self.messageReceived.emit(f"Error parsing response: {e}")
     
-    def send_command(self, command, param=None):
+    def send_command(self, command, param=None, hold=False):
+        """Add a command to the outgoing batch; never blocks the caller.
+        
+        Commands sent within TX_COALESCE_MS of each other go out in a single
+        write, each ending in a newline. With hold=True nothing is sent until flush() is called, so a
+        caller can build up a whole batch first.
+        """
         if not self.ser or not self.ser.is_open:
             self.messageReceived.emit("Serial port not open")
             return False
-            
-        cmd_str = command + str(param) if param is not None else command
-        self.ser.write(cmd_str.encode('utf-8'))
-        self.messageReceived.emit(f"Sent command: {cmd_str}")
+        
+        # Appended in place: no intermediate bytes object per command
+        buf = self._tx_buf
+        buf += CMD_BYTES[command]
+        if param is not None:
+            buf += PARAM_BYTES[param] if 0 <= param < len(PARAM_BYTES) else b"%d" % param
+        buf += CMD_END
+        self._tx_sent.append(f"{command}{'' if param is None else param}")
+        if command in MUTATING_COMMANDS:
+            self._mutation_in_batch = True
+        elif command == CMD_COUNT:
+            # A count already in the batch covers everything queued before it
+            self._mutation_in_batch = False
+        if not hold and not self._flush_timer.isActive():
+            self._flush_timer.start()
+        return True
+    
+    def flush(self):
+        """Hand the batched commands to the worker thread as one write"""
+        self._flush_timer.stop()
+        if not self._tx_buf:
+            return True
+        if self._mutation_in_batch:
+            # Rides along in the same write instead of a later round trip
+            self._tx_buf += CMD_BYTES[CMD_COUNT]
+            self._tx_buf += CMD_END
+            self._tx_sent.append(CMD_COUNT)
+            self._mutation_in_batch = False
+        # The buffer itself is handed over, so nothing is copied
+        batch = (self._tx_buf, self._tx_sent)
+        self._tx_buf = bytearray()
+        self._tx_sent = []
+        try:
+            self._tx_q.put_nowait(batch)
+        except queue.Full:
+            self.messageReceived.emit(f"Serial busy, commands {', '.join(batch[1])} dropped")
+            return False
+        # Wake the blocked read so the batch goes out now
+        if self.ser and self.ser.is_open:
+            self.ser.cancel_read()
         return True
     
-    def stop(self):
+    def _drain_commands(self):
+        """Write every queued batch with one write call, on the worker thread"""
+        try:
+            frame, sent = self._tx_q.get_nowait()
+        except queue.Empty:
+            return
+        # Usually there is just the one batch; otherwise gather them in the
+        # worker's reusable buffer rather than joining into a new one
+        while not self._tx_q.empty():
+            if frame is not self._tx_frame:
+                del self._tx_frame[:]
+                self._tx_frame += frame
+                frame = self._tx_frame
+            more, commands = self._tx_q.get_nowait()
+            frame += more
+            sent.extend(commands)
+        self._do_write(frame, sent)
+    
+    def _do_write(self, frame, sent):
+        try:
+            self.ser.write(frame)
+        except Exception as e:
+            self.messageReceived.emit(f"Serial write error: {e}")
+            return
+        # The sensor is busy from here until its READY frame, which the read
+        # loop picks up along with the response; no separate wait needed
+        if self.ready:
+            self.ready = False
+            self.readyChanged.emit(False)
+        self.messageReceived.emit(f"Sent command: {', '.join(sent)}")
+    
+    def request_stop(self):
+        """Ask run() to finish; returns at once, wait() for the thread to end"""
         self.running = False
         if self.ser and self.ser.is_open:
-            self.ser.close()
+            # Wake the blocked read, or a write stuck behind a stalled port,
+            # now instead of at its next timeout; run() closes the port on its way out
+            self.ser.cancel_read()
+            self.ser.cancel_write()
 
 
-class DatabaseManager:
+class DatabaseManager(QObject):
     """Class to handle database operations"""
-    def __init__(self, config):
+    # Emitted after a write has committed. Deletions are not signalled: the
+    # caller of bulk_delete_fingerprints knows which rows went
+    fingerprintsChanged = pyqtSignal()
+    lastAccessChanged = pyqtSignal(object)  # {fingerprint id: last_access text}
+    logsChanged = pyqtSignal()
+
+    # What each connection-bound operation returns while disconnected
+    DISCONNECTED_RESULTS = {
+        'enroll_fingerprint': False,
+        'verify_fingerprint': None,
+        'log_access_denied': None,
+        'flush_logs': None,
+        'bulk_delete_fingerprints': None,
+        'get_all_fingerprints': [],
+        'get_recent_logs': [],
+    }
+    # Statements prepared once per pooled connection and re-executed
+    STATEMENTS = {
+        'enroll': "INSERT INTO fingerprints (id, name, registration_date, last_access) "
+                  "VALUES (%s, %s, NOW(), NOW())",
+        'get_name': "SELECT name FROM fingerprints WHERE id = %s",
+        # Filled with one placeholder per ID in the chunk
+        'delete': "DELETE FROM fingerprints WHERE id IN ({})",
+    }
+    
+    def __init__(self, config, flush_threshold=LOG_FLUSH_THRESHOLD):
+        super().__init__()
         self.config = config
-        self.db = None
+        self.flush_threshold = flush_threshold
+        self.pool = None
+        self._log_buffer = deque()
+        # Held by whichever thread is writing buffered rows to the database
+        self._write_lock = threading.Lock()
+        # Server connection id -> {statement text: prepared cursor}
+        self._prepared = {}
+        # IN-list width -> DELETE text. A prepared cursor skips re-preparing
+        # only when handed the very same string object as last time
+        self._delete_sql = {}
+        # id -> name for every enrolled fingerprint; the sensor holds at most
+        # 127, so verification rarely needs to ask the database
+        self._name_cache = {}
+        # message -> (when its traceback was last logged, repeats since then)
+        self._error_log = {}
+        self._bind_disconnected()
+    
+    def _bind_disconnected(self):
+        """Shadow the operations with stubs so callers need no connection check"""
+        for name, result in self.DISCONNECTED_RESULTS.items():
+            setattr(self, name, self._disconnected_stub(result))
+    
+    def _bind_connected(self):
+        """Drop the stubs, exposing the real methods again"""
+        for name in self.DISCONNECTED_RESULTS:
+            self.__dict__.pop(name, None)
+    
+    @staticmethod
+    def _disconnected_stub(result):
+        def stub(*args, **kwargs):
+            return list(result) if isinstance(result, list) else result
+        return stub
         
     def connect(self):
         try:
@@ -121,137 +384,415 @@ class DatabaseManager:
             temp_cursor.close()
             temp_db.close()
             
-            self.db = mysql.connector.connect(**self.config)
+            self.pool = pooling.MySQLConnectionPool(
+                pool_name="fingerprint",
+                pool_size=DB_POOL_SIZE,
+                # A session reset would drop the server-side prepared statements
+                pool_reset_session=False,
+                # Single-statement writes commit on their own; multi-statement
+                # ones open a transaction explicitly
+                autocommit=True,
+                **self.config
+            )
             self.setup_database()
+            self._load_names()
+            self._bind_connected()
             return True
         except mysql.connector.Error as err:
             logger.error(f"Database connection error: {err}")
+            self.pool = None
+            return False
+    
+    @contextmanager
+    def connection(self):
+        """Check a pooled connection out for the duration of one operation"""
+        conn = self.pool.get_connection()
+        # Read now: a connection that has just failed may no longer report it
+        connection_id = conn.connection_id
+        try:
+            yield conn
+        except Exception:
+            # The connection may have been re-established; prepare afresh next time
+            self._prepared.pop(connection_id, None)
+            # Sessions are not reset on return, so never hand back an open transaction
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except mysql.connector.Error:
+                pass
+            raise
+        finally:
+            conn.close()
+    
+    def _prepared_cursor(self, conn, sql):
+        """Cached prepared cursor for sql on this connection"""
+        # Keyed by the server's id for the session: the pooled wrapper is
+        # replaced on every checkout, the session behind it is not
+        cursors = self._prepared.setdefault(conn.connection_id, {})
+        cursor = cursors.get(sql)
+        if cursor is None:
+            cursor = cursors[sql] = conn.cursor(prepared=True)
+        return cursor
+    
+    def _execute(self, conn, sql, params):
+        """Run a statement; it is parsed by the server only on first use"""
+        cursor = self._prepared_cursor(conn, sql)
+        cursor.execute(sql, params)
+        return cursor
+    
+    def is_connected(self):
+        """Probe the server with a pooled connection"""
+        if not self.pool:
+            return False
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+                cursor.close()
+            return True
+        except mysql.connector.Error:
             return False
     
     def setup_database(self):
-        cursor = self.db.cursor()
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS fingerprints (
-            id INT PRIMARY KEY,
-            name TEXT,
-            registration_date DATETIME,
-            last_access DATETIME
-        )''')
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS access_logs (
-            log_id INT AUTO_INCREMENT PRIMARY KEY,
-            fingerprint_id INT,
-            timestamp DATETIME,
-            confidence INT,
-            status VARCHAR(50),
-            FOREIGN KEY (fingerprint_id) REFERENCES fingerprints(id) ON DELETE SET NULL
-        )''')
-        self.db.commit()
-        cursor.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                id INT PRIMARY KEY,
+                name TEXT,
+                registration_date DATETIME,
+                last_access DATETIME
+            )''')
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS access_logs (
+                log_id INT AUTO_INCREMENT PRIMARY KEY,
+                fingerprint_id INT,
+                timestamp DATETIME,
+                confidence INT,
+                status VARCHAR(50),
+                FOREIGN KEY (fingerprint_id) REFERENCES fingerprints(id) ON DELETE SET NULL
+            )''')
+            # get_recent_logs orders by timestamp; MySQL has no CREATE INDEX IF NOT EXISTS
+            cursor.execute('''
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = 'access_logs'
+            AND index_name = 'idx_access_logs_ts'
+            ''')
+            if not cursor.fetchone()[0]:
+                cursor.execute('CREATE INDEX idx_access_logs_ts ON access_logs (timestamp DESC)')
+            cursor.close()
     
     def enroll_fingerprint(self, finger_id, name):
         if finger_id > 0:
             try:
-                cursor = self.db.cursor()
-                now = datetime.now()
-                cursor.execute("""
-                INSERT INTO fingerprints (id, name, registration_date, last_access) 
-                VALUES (%s, %s, %s, %s)
-                """, (finger_id, name, now, now))
-                self.db.commit()
-                cursor.close()
+                with self.connection() as conn:
+                    self._execute(conn, self.STATEMENTS['enroll'], (finger_id, name))
+                self._name_cache[finger_id] = name
+                self.fingerprintsChanged.emit()
                 logger.info('Finger print saved')
                 return True
             except Exception as err:
-                logger.exception("Database error during enrollment")
+                self._log_error("Database error during enrollment")
                 return False
     
     def verify_fingerprint(self, finger_id, confidence):
         try:
-            cursor = self.db.cursor()
-            cursor.execute("SELECT name FROM fingerprints WHERE id = %s", (finger_id,))
-            result = cursor.fetchone()
-            name = result[0] if result else 'Unknown'
-            
-            now = datetime.now()
-            cursor.execute("""
-                UPDATE fingerprints SET last_access = %s WHERE id = %s
-            """, (now, finger_id))
-            cursor.execute("""
-                INSERT INTO access_logs (fingerprint_id, timestamp, confidence, status) 
-                VALUES (%s, %s, %s, %s)
-            """, (finger_id, now, confidence, "ACCESS_GRANTED"))
-            self.db.commit()
-            cursor.close()
+            name = self._name_cache.get(finger_id)
+            if name is None:
+                # Enrolled or renamed from elsewhere since the names were loaded
+                name = self._fetch_name(finger_id)
+            if name is None:
+                # Matched on the sensor but never stored here; a log row would
+                # fail the foreign key
+                logger.warning(f"Fingerprint ID {finger_id} is not in the database")
+                return None
+            # last_access is brought up to date from the log row when it is flushed
+            self._queue_log(finger_id, datetime.now(), confidence, "ACCESS_GRANTED")
             return {'id': finger_id, 'name': name, 'confidence': confidence}
         except Exception as e:
-            logger.exception("Database error during verification")
+            self._log_error("Database error during verification")
             return None
     
+    def _log_error(self, message):
+        """logger.exception, throttled so an outage does not format the same
+        traceback on every timer tick"""
+        now = time.monotonic()
+        last, repeats = self._error_log.get(message, (None, 0))
+        if last is not None and now - last < ERROR_LOG_INTERVAL_S:
+            self._error_log[message] = (last, repeats + 1)
+            return
+        self._error_log[message] = (now, 0)
+        if repeats:
+            message = f"{message} ({repeats} more since last report)"
+        logger.exception(message)
+    
+    def _load_names(self):
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, name FROM fingerprints")
+            self._name_cache = dict(cursor.fetchall())
+            cursor.close()
+    
+    def _fetch_name(self, finger_id):
+        """Look one name up in the database and remember it; None if there is no such row"""
+        with self.connection() as conn:
+            rows = self._execute(conn, self.STATEMENTS['get_name'], (finger_id,)).fetchall()
+        if not rows:
+            return None
+        name = self._name_cache[finger_id] = rows[0][0]
+        return name
+    
+    def replace_names(self, names):
+        """Take id -> name from a fresh read of the fingerprints table"""
+        self._name_cache = dict(names)
+    
     def log_access_denied(self):
+        # No fingerprint matched, so there is no row for the foreign key to point at
+        self._queue_log(None, datetime.now(), 0, "ACCESS_DENIED")
+    
+    def _queue_log(self, finger_id, timestamp, confidence, status):
+        # DATETIME keeps whole seconds and the server would round; truncating
+        # here keeps lastAccessChanged identical to what gets stored
+        self._log_buffer.append((finger_id, timestamp.replace(microsecond=0), confidence, status))
+        if status in URGENT_LOG_STATUSES or len(self._log_buffer) >= self.flush_threshold:
+            self.flush_logs()
+    
+    def _take_logs(self):
+        """Remove and return the buffered access log rows"""
+        # popleft rather than copy-and-clear: rows may be queued from another
+        # thread while this runs
+        return [self._log_buffer.popleft() for _ in range(len(self._log_buffer))]
+    
+    def _requeue_logs(self, rows):
+        """Put rows whose transaction failed back in front of the buffer, in order"""
+        overflow = len(rows) + len(self._log_buffer) - LOG_BUFFER_LIMIT
+        if overflow > 0:
+            logger.warning(f"Access log buffer full, dropping the {overflow} oldest rows")
+            rows = rows[overflow:]
+        self._log_buffer.extendleft(reversed(rows))
+    
+    def _write_logs(self, cursor, rows):
+        """Insert access log rows as one multi-row INSERT and apply the
+        last_access updates they imply. Returns the change notifications to
+        send once the caller has committed"""
+        if not rows:
+            return ()
+        # IGNORE skips a row whose fingerprint was deleted outside this
+        # application instead of failing the foreign key for the whole batch
+        cursor.executemany("""
+            INSERT IGNORE INTO access_logs (fingerprint_id, timestamp, confidence, status) 
+            VALUES (%s, %s, %s, %s)
+        """, rows)
+        
+        # Every granted access also touches last_access; only the latest one
+        # per fingerprint matters
+        last_access = {}
+        for finger_id, timestamp, _, status in rows:
+            if status == "ACCESS_GRANTED":
+                last_access[finger_id] = max(timestamp, last_access.get(finger_id, timestamp))
+        if last_access:
+            # executemany would send one UPDATE per fingerprint; a CASE covers
+            # them all in a single statement
+            cases = " ".join(["WHEN %s THEN %s"] * len(last_access))
+            ids = ", ".join(["%s"] * len(last_access))
+            params = [value for item in last_access.items() for value in item]
+            cursor.execute(
+                f"UPDATE fingerprints SET last_access = CASE id {cases} END WHERE id IN ({ids})",
+                params + list(last_access)
+            )
+            shown = {finger_id: str(timestamp) for finger_id, timestamp in last_access.items()}
+            return (self.logsChanged.emit, functools.partial(self.lastAccessChanged.emit, shown))
+        return (self.logsChanged.emit,)
+    
+    def flush_logs(self):
+        """Write any buffered access log rows to the database"""
+        if not self._log_buffer:
+            return
+        # A bulk delete running on the pool writes the buffer as part of its
+        # transaction; never make the GUI thread wait for it
+        if not self._write_lock.acquire(blocking=False):
+            return
+        rows = self._take_logs()
         try:
-            cursor = self.db.cursor()
-            now = datetime.now()
-            cursor.execute("""
-                INSERT INTO access_logs (fingerprint_id, timestamp, confidence, status) 
-                VALUES (%s, %s, %s, %s)
-            """, (0, now, 0, "ACCESS_DENIED"))
-            self.db.commit()
-            cursor.close()
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                conn.start_transaction()
+                changed = self._write_logs(cursor, rows)
+                conn.commit()
+                cursor.close()
         except Exception:
-            logger.exception("Database error logging failed access")
+            # Kept for the next flush rather than lost with the transaction
+            self._requeue_logs(rows)
+            self._log_error("Database error writing access logs")
+            return
+        finally:
+            self._write_lock.release()
+        for notify in changed:
+            notify()
     
-    def delete_fingerprint(self, finger_id):
+    def bulk_delete_fingerprints(self, finger_ids):
+        """Delete fingerprints in one transaction; returns how many rows went,
+        or None on a database error. Safe to call off the GUI thread"""
+        if not finger_ids:
+            return 0
+        rows = None
         try:
-            cursor = self.db.cursor()
-            now = datetime.now()
-            cursor.execute("""
-                INSERT INTO access_logs (fingerprint_id, timestamp, confidence, status) 
-                VALUES (%s, %s, %s, %s)
-            """, (finger_id, now, 0, "DELETED"))
-            cursor.execute("DELETE FROM fingerprints WHERE id = %s", (finger_id,))
-            self.db.commit()
-            deleted = cursor.rowcount
-            cursor.close()
-            return deleted > 0
+            with self._write_lock, self.connection() as conn:
+                cursor = conn.cursor()
+                conn.start_transaction()
+                # The log rows must land before the fingerprint rows go away so
+                # ON DELETE SET NULL applies instead of the foreign key rejecting them
+                rows = self._take_logs()
+                now = datetime.now().replace(microsecond=0)
+                deleted_rows = [(finger_id, now, 0, "DELETED") for finger_id in finger_ids]
+                changed = self._write_logs(cursor, rows + deleted_rows)
+                deleted = 0
+                for i in range(0, len(finger_ids), DELETE_CHUNK_SIZE):
+                    chunk = finger_ids[i:i + DELETE_CHUNK_SIZE]
+                    # Pad the list to a power of two by repeating the last ID, so
+                    # a handful of prepared statements covers every batch size
+                    width = 1 << (len(chunk) - 1).bit_length()
+                    chunk += [chunk[-1]] * (width - len(chunk))
+                    sql = self._delete_sql.get(width)
+                    if sql is None:
+                        sql = self._delete_sql[width] = self.STATEMENTS['delete'].format(
+                            ", ".join(["%s"] * width))
+                    deleted += self._execute(conn, sql, chunk).rowcount
+                conn.commit()
+                cursor.close()
+            for finger_id in finger_ids:
+                self._name_cache.pop(finger_id, None)
+            for notify in changed:
+                notify()
+            return deleted
         except Exception:
-            logger.exception("Database error during deletion")
-            return False
+            # Rows buffered before the delete are written by the next flush;
+            # the DELETED rows go, since nothing was deleted
+            if rows:
+                self._requeue_logs(rows)
+            self._log_error("Database error during deletion")
+            return None
     
     def get_all_fingerprints(self):
         try:
-            cursor = self.db.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM fingerprints ORDER BY id")
-            records = cursor.fetchall()
-            cursor.close()
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                # Let the server render the dates as text: the table only ever
+                # displays them, so there is no point building datetimes per row
+                cursor.execute("""
+                SELECT id, name,
+                       CAST(registration_date AS CHAR) AS registration_date,
+                       IFNULL(CAST(last_access AS CHAR), '') AS last_access
+                FROM fingerprints ORDER BY id
+                """)
+                records = cursor.fetchall()
+                cursor.close()
             return records
         except Exception as e:
-            logger.exception("Error fetching fingerprints")
+            self._log_error("Error fetching fingerprints")
             return []
     
     def get_recent_logs(self, limit=50):
         try:
-            cursor = self.db.cursor(dictionary=True)
-            cursor.execute("""
-            SELECT l.log_id, l.fingerprint_id, f.name, l.timestamp, l.confidence, l.status 
-            FROM access_logs l 
-            LEFT JOIN fingerprints f ON l.fingerprint_id = f.id 
-            ORDER BY l.timestamp DESC 
-            LIMIT %s
-            """, (limit,))
-            logs = cursor.fetchall()
-            cursor.close()
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                # Name fallback and timestamp text come from the server, as in
+                # get_all_fingerprints
+                cursor.execute("""
+                SELECT l.log_id, l.fingerprint_id, COALESCE(f.name, 'Unknown') AS name,
+                       CAST(l.timestamp AS CHAR) AS timestamp, l.confidence, l.status 
+                FROM access_logs l 
+                LEFT JOIN fingerprints f ON l.fingerprint_id = f.id 
+                ORDER BY l.timestamp DESC 
+                LIMIT %s
+                """, (limit,))
+                logs = cursor.fetchall()
+                cursor.close()
             return logs
         except Exception as e:
-            logger.exception("Error fetching access logs")
+            self._log_error("Error fetching access logs")
             return []
     
     def close(self):
-        if self.db and self.db.is_connected():
-            self.db.close()
+        if self.pool:
+            self.flush_logs()
+            self._prepared.clear()
+            # Idle connections sit in the pool's queue. Check each one out and
+            # disconnect it: closing a pooled connection would only hand it back.
+            # A failed reconnect puts the connection back and raises, so stop
+            # there rather than retrying it against an unreachable server
+            for _ in range(self.pool.pool_size):
+                try:
+                    conn = self.pool.get_connection()
+                except mysql.connector.Error:
+                    break
+                conn.disconnect()
+            self.pool = None
+        self._bind_disconnected()
+
+class DbJobSignals(QObject):
+    finished = pyqtSignal(object)
+
+
+class DbJob(QRunnable):
+    """One DatabaseManager call run on a thread pool; its result comes back
+    through signals.finished on the thread that connected to it"""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = DbJobSignals()
+    
+    def run(self):
+        self.signals.finished.emit(self.fn(*self.args))
+
+
+class DbWorker(QObject):
+    """Runs the refresh queries on its own thread so the GUI never waits on MySQL"""
+    # object rather than list: a QVariantList round trip would turn the
+    # rows' datetimes into QDateTimes
+    fingerprintsReady = pyqtSignal(int, object)
+    logsReady = pyqtSignal(object)
+    connectionChecked = pyqtSignal(bool)
+    
+    def __init__(self, config):
+        super().__init__()
+        # Connections must stay on the thread that uses them, so the worker
+        # keeps its own manager instead of sharing the GUI's
+        self.db_manager = DatabaseManager(config)
+    
+    @pyqtSlot(dict)
+    def set_config(self, config):
+        self.db_manager.close()
+        self.db_manager = DatabaseManager(config)
+        self.db_manager.connect()
+    
+    @pyqtSlot(int)
+    def refresh_fingerprints(self, rev):
+        # rev comes back with the rows so the window can spot stale results
+        self.fingerprintsReady.emit(rev, self.db_manager.get_all_fingerprints())
+    
+    @pyqtSlot()
+    def refresh_logs(self):
+        self.logsReady.emit(self.db_manager.get_recent_logs())
+    
+    @pyqtSlot()
+    def check_connection(self):
+        self.connectionChecked.emit(self.db_manager.is_connected())
+    
+    @pyqtSlot()
+    def close(self):
+        self.db_manager.close()
 
 
 class MainWindow(QMainWindow):
+    dbConfigChanged = pyqtSignal(dict)
+    fingerprintsRequested = pyqtSignal(int)
+    logsRequested = pyqtSignal()
+    connectionCheckRequested = pyqtSignal()
+    dbCloseRequested = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Fingerprint Management System")
@@ -259,13 +800,59 @@ class MainWindow(QMainWindow):
         
         self.serial_worker = None
         self.db_manager = DatabaseManager(DB_CONFIG)
+        self.watch_db_manager()
+        
+        # Rows last written to each table, so a refresh only touches what changed
+        self._snapshots = {}
+        # Fingerprint ID -> the name item of its row in fingerprints_table;
+        # items follow their row when others are removed, indexes would not
+        self._row_by_id = {}
+        # Fingerprints as last shown. Local changes edit the cache and bump
+        # fp_rev; only fp_dirty sends a refresh to the database
+        self.fp_cache = []
+        self.fp_rev = 0
+        self.fp_dirty = True
+        # Refresh requests arriving within 50 ms of each other are served once
+        self._pending_refresh = set()
+        # Deletes commit off the GUI thread; one thread keeps writes in order
+        self.db_pool = QThreadPool()
+        self.db_pool.setMaxThreadCount(1)
+        self._delete_job = None
+        
+        # Status bar text is shown at most every 50 ms, latest message wins
+        self._last_status = None
+        self._status_timer = QTimer(singleShot=True)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # A bulk delete keeps up to DELETES_IN_FLIGHT sensor commands
+        # unanswered, queues the rest, and touches the database once, after
+        # the last acknowledgement
+        self._pending_deletes = set()
+        self._delete_queue = deque()
+        self._deleted_ids = []
+        # Ends the batch if an acknowledgement is lost or never sent
+        self._delete_deadline = QTimer(singleShot=True)
+        self._delete_deadline.setInterval(DELETE_REPLY_TIMEOUT_MS)
+        self._delete_deadline.timeout.connect(self.finish_bulk_delete)
         
         self.init_ui()
+        self.start_db_worker()
         self.connect_serial()
         
+        # Tables refresh when this application writes to them (see
+        # watch_db_manager); the slow timer only picks up changes made to the
+        # database from elsewhere
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_data)
-        self.refresh_timer.start(5000) 
+        self.refresh_timer.start(REFRESH_INTERVAL_MS)
+        
+        self.status_timer = QTimer()
+        self.status_timer.timeout.connect(self.update_dashboard)
+        self.status_timer.start(5000)
+        
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.timeout.connect(self.flush_logs)
+        self.log_flush_timer.start(LOG_FLUSH_INTERVAL_MS)
         
         self.pending_enrollment_name = None
     
@@ -275,26 +862,20 @@ class MainWindow(QMainWindow):
 
         self.tabs = QTabWidget()
         
-        self.dashboard_tab = QWidget()
-        self.enrollment_tab = QWidget()
-        self.verification_tab = QWidget()
-        self.fingerprints_tab = QWidget()
-        self.logs_tab = QWidget()
-        self.settings_tab = QWidget()
-        
-        self.tabs.addTab(self.dashboard_tab, "Dashboard")
-        self.tabs.addTab(self.enrollment_tab, "Enroll")
-        self.tabs.addTab(self.verification_tab, "Verify")
-        self.tabs.addTab(self.fingerprints_tab, "Fingerprints")
-        self.tabs.addTab(self.logs_tab, "Access Logs")
-        self.tabs.addTab(self.settings_tab, "Settings")
-        
-        self.setup_dashboard_tab()
-        self.setup_enrollment_tab()
-        self.setup_verification_tab()
-        self.setup_fingerprints_tab()
-        self.setup_logs_tab()
-        self.setup_settings_tab()
+        # (attribute, tab title, builder filling the tab in)
+        tab_specs = [
+            ('dashboard_tab', "Dashboard", self.setup_dashboard_tab),
+            ('enrollment_tab', "Enroll", self.setup_enrollment_tab),
+            ('verification_tab', "Verify", self.setup_verification_tab),
+            ('fingerprints_tab', "Fingerprints", self.setup_fingerprints_tab),
+            ('logs_tab', "Access Logs", self.setup_logs_tab),
+            ('settings_tab', "Settings", self.setup_settings_tab),
+        ]
+        for attr, title, setup in tab_specs:
+            tab = QWidget()
+            setattr(self, attr, tab)
+            self.tabs.addTab(tab, title)
+            setup()
         
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
@@ -303,32 +884,48 @@ class MainWindow(QMainWindow):
         
         self.setCentralWidget(central_widget)
     
+    @staticmethod
+    def _form_layout(rows):
+        """QFormLayout holding (label, widget) rows"""
+        form = QFormLayout()
+        for label, widget in rows:
+            form.addRow(label, widget)
+        return form
+    
+    @classmethod
+    def _form_group(cls, title, rows):
+        """QGroupBox around a form of (label, widget) rows"""
+        group = QGroupBox(title)
+        group.setLayout(cls._form_layout(rows))
+        return group
+    
+    @staticmethod
+    def _button(text, slot):
+        """QPushButton wired to slot"""
+        button = QPushButton(text)
+        button.clicked.connect(slot)
+        return button
+    
     def setup_dashboard_tab(self):
         layout = QVBoxLayout()
         
-        status_group = QGroupBox("System Status")
-        status_layout = QFormLayout()
-        
         self.serial_status_label = QLabel("Disconnected")
         self.database_status_label = QLabel("Disconnected")
         self.sensor_status_label = QLabel("Unknown")
         self.template_count_label = QLabel("0")
         
-        status_layout.addRow("Serial Connection:", self.serial_status_label)
-        status_layout.addRow("Database Connection:", self.database_status_label)
-        status_layout.addRow("Fingerprint Sensor:", self.sensor_status_label)
-        status_layout.addRow("Stored Templates:", self.template_count_label)
-        
-        status_group.setLayout(status_layout)
+        status_group = self._form_group("System Status", [
+            ("Serial Connection:", self.serial_status_label),
+            ("Database Connection:", self.database_status_label),
+            ("Fingerprint Sensor:", self.sensor_status_label),
+            ("Stored Templates:", self.template_count_label),
+        ])
         
         actions_group = QGroupBox("Quick Actions")
         actions_layout = QVBoxLayout()
         
-        self.verify_btn = QPushButton("Verify Fingerprint")
-        self.verify_btn.clicked.connect(self.quick_verify)
-        
-        self.count_btn = QPushButton("Count Templates")
-        self.count_btn.clicked.connect(self.get_template_count)
+        self.verify_btn = self._button("Verify Fingerprint", self.quick_verify)
+        self.count_btn = self._button("Count Templates", self.get_template_count)
         
         actions_layout.addWidget(self.verify_btn)
         actions_layout.addWidget(self.count_btn)
@@ -353,15 +950,15 @@ class MainWindow(QMainWindow):
     def setup_enrollment_tab(self):
         layout = QVBoxLayout()
         
-        form_layout = QFormLayout()
-        
         self.enrollment_id_spin = QSpinBox()
         self.enrollment_id_spin.setRange(1, 127)
         
         self.enrollment_name_edit = QLineEdit()
         
-        form_layout.addRow("Fingerprint ID:", self.enrollment_id_spin)
-        form_layout.addRow("Person Name:", self.enrollment_name_edit)
+        form_layout = self._form_layout([
+            ("Fingerprint ID:", self.enrollment_id_spin),
+            ("Person Name:", self.enrollment_name_edit),
+        ])
         
         self.enrollment_status_label = QLabel("Ready to enroll")
         self.enrollment_status_label.setAlignment(Qt.AlignCenter)
@@ -375,8 +972,7 @@ class MainWindow(QMainWindow):
         )
         instructions_label.setAlignment(Qt.AlignCenter)
         
-        self.enroll_button = QPushButton("Start Enrollment")
-        self.enroll_button.clicked.connect(self.start_enrollment)
+        self.enroll_button = self._button("Start Enrollment", self.start_enrollment)
         
         layout.addLayout(form_layout)
         layout.addWidget(instructions_label)
@@ -393,6 +989,21 @@ class MainWindow(QMainWindow):
         self.verification_status_label.setAlignment(Qt.AlignCenter)
         self.verification_status_label.setFont(QFont("Arial", 14))
         
+        # Result styles built once; a palette/font swap restyles only the label,
+        # where setStyleSheet would re-parse and re-polish it on every result
+        label = self.verification_status_label
+        granted_palette = QPalette(label.palette())
+        granted_palette.setColor(QPalette.WindowText, QColor("green"))
+        failed_palette = QPalette(label.palette())
+        failed_palette.setColor(QPalette.WindowText, QColor("red"))
+        bold_font = QFont(label.font())
+        bold_font.setBold(True)
+        self._verification_styles = {
+            'neutral': (QPalette(label.palette()), QFont(label.font())),
+            'granted': (granted_palette, bold_font),
+            'failed': (failed_palette, QFont(label.font())),
+        }
+        
         instructions_label = QLabel(
             "Instructions:\n"
             "1. Click 'Start Verification'\n"
@@ -401,23 +1012,19 @@ class MainWindow(QMainWindow):
         )
         instructions_label.setAlignment(Qt.AlignCenter)
         
-        result_group = QGroupBox("Verification Result")
-        result_layout = QFormLayout()
-        
         self.verify_id_label = QLabel("--")
         self.verify_name_label = QLabel("--")
         self.verify_confidence_label = QLabel("--")
         self.verify_time_label = QLabel("--")
         
-        result_layout.addRow("ID:", self.verify_id_label)
-        result_layout.addRow("Name:", self.verify_name_label)
-        result_layout.addRow("Confidence:", self.verify_confidence_label)
-        result_layout.addRow("Time:", self.verify_time_label)
-        
-        result_group.setLayout(result_layout)
+        result_group = self._form_group("Verification Result", [
+            ("ID:", self.verify_id_label),
+            ("Name:", self.verify_name_label),
+            ("Confidence:", self.verify_confidence_label),
+            ("Time:", self.verify_time_label),
+        ])
 
-        self.verify_button = QPushButton("Start Verification")
-        self.verify_button.clicked.connect(self.start_verification)
+        self.verify_button = self._button("Start Verification", self.start_verification)
         self.verify_button.setMinimumHeight(50)
         
         layout.addWidget(instructions_label)
@@ -438,11 +1045,8 @@ class MainWindow(QMainWindow):
         
         buttons_layout = QHBoxLayout()
         
-        self.refresh_fingerprints_btn = QPushButton("Refresh")
-        self.refresh_fingerprints_btn.clicked.connect(self.refresh_fingerprints)
-        
-        self.delete_fingerprint_btn = QPushButton("Delete Selected")
-        self.delete_fingerprint_btn.clicked.connect(self.delete_selected_fingerprint)
+        self.refresh_fingerprints_btn = self._button("Refresh", self.reload_fingerprints)
+        self.delete_fingerprint_btn = self._button("Delete Selected", self.delete_selected_fingerprint)
         
         buttons_layout.addWidget(self.refresh_fingerprints_btn)
         buttons_layout.addWidget(self.delete_fingerprint_btn)
@@ -459,8 +1063,7 @@ class MainWindow(QMainWindow):
         self.logs_table.setHorizontalHeaderLabels(["Log ID", "Fingerprint ID", "Name", "Timestamp", "Confidence", "Status"])
         self.logs_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
-        self.refresh_logs_btn = QPushButton("Refresh Logs")
-        self.refresh_logs_btn.clicked.connect(self.refresh_logs)
+        self.refresh_logs_btn = self._button("Refresh Logs", self.refresh_logs)
         
         layout.addWidget(self.logs_table)
         layout.addWidget(self.refresh_logs_btn)
@@ -470,9 +1073,6 @@ class MainWindow(QMainWindow):
     def setup_settings_tab(self):
         layout = QVBoxLayout()
         
-        serial_group = QGroupBox("Serial Connection")
-        serial_layout = QFormLayout()
-        
         self.serial_port_combo = QComboBox()
         for i in range(10):
             if sys.platform == "win32":
@@ -490,17 +1090,13 @@ class MainWindow(QMainWindow):
         
         self.baud_rate_combo.setCurrentText(str(BAUD_RATE))
         
-        self.serial_connect_btn = QPushButton("Connect")
-        self.serial_connect_btn.clicked.connect(self.connect_serial)
-        
-        serial_layout.addRow("Port:", self.serial_port_combo)
-        serial_layout.addRow("Baud Rate:", self.baud_rate_combo)
-        serial_layout.addRow("", self.serial_connect_btn)
-        
-        serial_group.setLayout(serial_layout)
+        self.serial_connect_btn = self._button("Connect", self.connect_serial)
         
-        db_group = QGroupBox("Database Connection")
-        db_layout = QFormLayout()
+        serial_group = self._form_group("Serial Connection", [
+            ("Port:", self.serial_port_combo),
+            ("Baud Rate:", self.baud_rate_combo),
+            ("", self.serial_connect_btn),
+        ])
         
         self.db_host_edit = QLineEdit(DB_CONFIG['host'])
         self.db_name_edit = QLineEdit(DB_CONFIG['database'])
@@ -508,16 +1104,15 @@ class MainWindow(QMainWindow):
         self.db_password_edit = QLineEdit(DB_CONFIG['password'])
         self.db_password_edit.setEchoMode(QLineEdit.Password)
         
-        self.db_connect_btn = QPushButton("Connect")
-        self.db_connect_btn.clicked.connect(self.connect_database)
+        self.db_connect_btn = self._button("Connect", self.connect_database)
         
-        db_layout.addRow("Host:", self.db_host_edit)
-        db_layout.addRow("Database:", self.db_name_edit)
-        db_layout.addRow("Username:", self.db_user_edit)
-        db_layout.addRow("Password:", self.db_password_edit)
-        db_layout.addRow("", self.db_connect_btn)
-        
-        db_group.setLayout(db_layout)
+        db_group = self._form_group("Database Connection", [
+            ("Host:", self.db_host_edit),
+            ("Database:", self.db_name_edit),
+            ("Username:", self.db_user_edit),
+            ("Password:", self.db_password_edit),
+            ("", self.db_connect_btn),
+        ])
         
         layout.addWidget(serial_group)
         layout.addWidget(db_group)
@@ -527,7 +1122,7 @@ class MainWindow(QMainWindow):
     
     def connect_serial(self):
         if self.serial_worker:
-            self.serial_worker.stop()
+            self.serial_worker.request_stop()
             self.serial_worker.wait()
         
         if hasattr(self, 'serial_port_combo'):
@@ -537,6 +1132,12 @@ class MainWindow(QMainWindow):
             port = SERIAL_PORT
             baud_rate = BAUD_RATE
         
+        # Acknowledgements for a running bulk delete died with the old worker
+        self._pending_deletes.clear()
+        self._delete_queue.clear()
+        self._deleted_ids = []
+        self._delete_deadline.stop()
+        
         self.serial_worker = SerialWorker(port, baud_rate)
         self.serial_worker.messageReceived.connect(self.handle_message)
         
@@ -545,9 +1146,26 @@ class MainWindow(QMainWindow):
         self.serial_worker.readyChanged.connect(self.handle_ready_changed)
         self.serial_worker.start()
         
-        self.status_bar.showMessage(f"Connecting to serial port {port}...")
+        self._status(f"Connecting to serial port {port}...", 0)
         self.serial_status_label.setText(f"Connecting to {port}...")
     
+    def start_db_worker(self):
+        self.db_thread = QThread()
+        self.db_worker = DbWorker(DB_CONFIG)
+        self.db_worker.moveToThread(self.db_thread)
+        
+        self.dbConfigChanged.connect(self.db_worker.set_config)
+        self.fingerprintsRequested.connect(self.db_worker.refresh_fingerprints)
+        self.logsRequested.connect(self.db_worker.refresh_logs)
+        self.connectionCheckRequested.connect(self.db_worker.check_connection)
+        self.dbCloseRequested.connect(self.db_worker.close, Qt.BlockingQueuedConnection)
+        
+        self.db_worker.fingerprintsReady.connect(self.populate_fingerprints, Qt.QueuedConnection)
+        self.db_worker.logsReady.connect(self.populate_logs, Qt.QueuedConnection)
+        self.db_worker.connectionChecked.connect(self.update_database_status, Qt.QueuedConnection)
+        
+        self.db_thread.start()
+    
     def connect_database(self):
         config = {
             'host': self.db_host_edit.text(),
@@ -556,58 +1174,165 @@ class MainWindow(QMainWindow):
             'database': self.db_name_edit.text()
         }
         
+        self.db_pool.waitForDone()
         if self.db_manager:
             self.db_manager.close()
         
         self.db_manager = DatabaseManager(config)
+        self.watch_db_manager()
         
         if self.db_manager.connect():
+            self.dbConfigChanged.emit(config)
             self.database_status_label.setText("Connected")
-            self.status_bar.showMessage("Connected to database", 3000)
+            self._status("Connected to database", 3000)
             self.refresh_data()
         else:
             self.database_status_label.setText("Disconnected")
             QMessageBox.critical(self, "Database Error", "Failed to connect to database")
     
+    def watch_db_manager(self):
+        """Refresh the tables whenever the current manager commits a write"""
+        self.db_manager.fingerprintsChanged.connect(self.invalidate_fingerprints)
+        self.db_manager.lastAccessChanged.connect(self.apply_last_access)
+        self.db_manager.logsChanged.connect(
+            functools.partial(self.schedule_refresh, self.refresh_logs))
+    
+    def schedule_refresh(self, refresh):
+        """Run refresh shortly, once, however many changes ask for it meanwhile"""
+        if not self._pending_refresh:
+            QTimer.singleShot(50, self._do_refresh)
+        self._pending_refresh.add(refresh)
+    
+    def _do_refresh(self):
+        pending, self._pending_refresh = self._pending_refresh, set()
+        for refresh in pending:
+            refresh()
+    
+    def flush_logs(self):
+        """Write access log rows buffered since the last tick"""
+        self.db_manager.flush_logs()
+    
     def refresh_data(self):
         """Refresh data tables"""
-        self.refresh_fingerprints()
+        self.db_manager.flush_logs()
+        # The timer is the only way to see edits made outside this application
+        self.reload_fingerprints()
         self.refresh_logs()
         self.update_dashboard()
     
+    def reload_fingerprints(self):
+        """Discard the cached fingerprints and query the database again"""
+        self.fp_dirty = True
+        self.refresh_fingerprints()
+    
+    def invalidate_fingerprints(self):
+        """A change the cache cannot mirror, such as an enrollment, committed"""
+        self.fp_dirty = True
+        self.fp_rev += 1
+        self.schedule_refresh(self.refresh_fingerprints)
+    
     def refresh_fingerprints(self):
-        """Refresh the fingerprints table"""
-        fingerprints = self.db_manager.get_all_fingerprints()
-        self.fingerprints_table.setRowCount(len(fingerprints))
+        """Ask the database worker for the fingerprints table if the cache is stale"""
+        if self.fp_dirty:
+            self.fingerprintsRequested.emit(self.fp_rev)
+    
+    def populate_fingerprints(self, rev, fingerprints):
+        """Take rows from the database worker, unless a local change overtook them"""
+        if rev != self.fp_rev:
+            # Queried before the latest change; ask again if the cache needs it
+            self.refresh_fingerprints()
+            return
+        self.fp_cache = list(fingerprints)
+        self.fp_dirty = False
+        # Also how renames made outside this application reach verification
+        self.db_manager.replace_names((row[0], row[1]) for row in self.fp_cache)
+        self.show_fingerprints()
+    
+    def show_fingerprints(self):
+        table = self.fingerprints_table
+        self.sync_table(table, [
+            (str(finger_id), name, registration_date, last_access)
+            for finger_id, name, registration_date, last_access in self.fp_cache
+        ])
+        self._row_by_id = {}
+        for i, row in enumerate(self.fp_cache):
+            # The ID rides on the name item so selections need no text parsing
+            item = table.item(i, 1)
+            self._row_by_id[row[0]] = item
+            if item.data(Qt.UserRole) != row[0]:
+                item.setData(Qt.UserRole, row[0])
+    
+    def apply_last_access(self, last_access):
+        """Mirror flushed verifications into the cache instead of reloading"""
+        self.fp_cache = [
+            (finger_id, name, registration_date, last_access.get(finger_id, previous))
+            for finger_id, name, registration_date, previous in self.fp_cache
+        ]
+        self.fp_rev += 1
+        self.show_fingerprints()
+    
+    def remove_fingerprint_rows(self, finger_ids):
+        """Drop rows from the fingerprints table in place, ahead of the next refresh"""
+        table = self.fingerprints_table
+        snapshot = list(self._snapshots.get(table, []))
+        rows = sorted((table.row(self._row_by_id.pop(finger_id)) for finger_id in finger_ids
+                       if finger_id in self._row_by_id), reverse=True)
+        if not rows:
+            return
         
-        for i, fp in enumerate(fingerprints):
-            self.fingerprints_table.setItem(i, 0, QTableWidgetItem(str(fp['id'])))
-            self.fingerprints_table.setItem(i, 1, QTableWidgetItem(fp['name']))
-            self.fingerprints_table.setItem(i, 2, QTableWidgetItem(str(fp['registration_date'])))
-            self.fingerprints_table.setItem(i, 3, QTableWidgetItem(str(fp['last_access'])))
+        table.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                table.removeRow(row)
+                del snapshot[row]
+        finally:
+            table.setUpdatesEnabled(True)
+        # Keep the snapshot in step so the next sync diffs against what is shown
+        self._snapshots[table] = snapshot
     
     def refresh_logs(self):
-        """Refresh the logs table"""
-        logs = self.db_manager.get_recent_logs()
-        self.logs_table.setRowCount(len(logs))
-        
-        for i, log in enumerate(logs):
-            self.logs_table.setItem(i, 0, QTableWidgetItem(str(log['log_id'])))
-            self.logs_table.setItem(i, 1, QTableWidgetItem(str(log['fingerprint_id'])))
-            self.logs_table.setItem(i, 2, QTableWidgetItem(log['name'] if log['name'] else 'Unknown'))
-            self.logs_table.setItem(i, 3, QTableWidgetItem(str(log['timestamp'])))
-            self.logs_table.setItem(i, 4, QTableWidgetItem(str(log['confidence'])))
-            self.logs_table.setItem(i, 5, QTableWidgetItem(log['status']))
-    
-        recent_logs = logs[:5]
-        self.recent_logs_table.setRowCount(len(recent_logs))
-        
-        for i, log in enumerate(recent_logs):
-            self.recent_logs_table.setItem(i, 0, QTableWidgetItem(str(log['fingerprint_id'])))
-            self.recent_logs_table.setItem(i, 1, QTableWidgetItem(log['name'] if log['name'] else 'Unknown'))
-            self.recent_logs_table.setItem(i, 2, QTableWidgetItem(str(log['timestamp'])))
-            self.recent_logs_table.setItem(i, 3, QTableWidgetItem(log['status']))
-            self.recent_logs_table.setItem(i, 4, QTableWidgetItem(str(log['confidence'])))
+        """Ask the database worker for fresh access logs"""
+        self.logsRequested.emit()
+    
+    def populate_logs(self, logs):
+        """Fill the logs and recent activity tables with rows from the database worker"""
+        self.sync_table(self.logs_table, [
+            (str(log_id), str(finger_id), name, timestamp, str(confidence), status)
+            for log_id, finger_id, name, timestamp, confidence, status in logs
+        ])
+        
+        self.sync_table(self.recent_logs_table, [
+            (str(finger_id), name, timestamp, status, str(confidence))
+            for log_id, finger_id, name, timestamp, confidence, status in logs[:5]
+        ])
+    
+    def sync_table(self, table, rows):
+        """Bring a table in line with rows, only rewriting the cells that differ
+        from the previous refresh and reusing the existing items"""
+        previous = self._snapshots.get(table, [])
+        if rows == previous:
+            return
+        
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
+            for i, row in enumerate(rows):
+                old = previous[i] if i < len(previous) else ()
+                if row == old:
+                    continue
+                for col, text in enumerate(row):
+                    if col < len(old) and old[col] == text:
+                        continue
+                    item = table.item(i, col)
+                    if item is None:
+                        table.setItem(i, col, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+        self._snapshots[table] = rows
     
     def update_dashboard(self):
         """Update dashboard information"""
@@ -616,108 +1341,64 @@ class MainWindow(QMainWindow):
         else:
             self.serial_status_label.setText("Disconnected")
             
-        if not self.db_manager or not hasattr(self.db_manager, 'db') or not self.db_manager.db or not self.db_manager.db.is_connected():
-            self.database_status_label.setText("Disconnected")
-        else:
-            self.database_status_label.setText("Connected")
-            
+        self.connectionCheckRequested.emit()
+    
+    def update_database_status(self, connected):
+        """Show the result of the database worker's connection probe"""
+        self.database_status_label.setText("Connected" if connected else "Disconnected")
+        # Refreshing or flushing against an unreachable server only produces
+        # errors; pause both and catch up once the probe succeeds again
+        if not connected:
+            self.refresh_timer.stop()
+            self.log_flush_timer.stop()
+        elif not self.refresh_timer.isActive():
+            self.refresh_timer.start(REFRESH_INTERVAL_MS)
+            self.log_flush_timer.start(LOG_FLUSH_INTERVAL_MS)
+            self.refresh_data()
+    
+    def _status(self, message, timeout=3000):
+        """Queue a status bar message; bursts collapse to the latest one"""
+        self._last_status = (message, timeout)
+        if not self._status_timer.isActive():
+            self._status_timer.start(50)
+    
+    def _flush_status(self):
+        """Show the latest message held back by _status"""
+        self.status_bar.showMessage(*self._last_status)
     
     def handle_message(self, message):
         """Handle messages from the serial worker"""
-        self.status_bar.showMessage(message, 3000)
+        self._status(message)
     
     def handle_response(self, response):
-        """Handle responses from the fingerprint sensor"""
-        logger.info(f"Sensor Response: {response} {response['type']}")  
-
-    
-        logger.info("Handling successful enrollment response")
-        self.handle_enrollment_response(response)
-        
-        logger.info('here')
-        """Handle successful enrollment response and save to MySQL DB"""
-        
+        """Dispatch a sensor response to the handler for the operation it answers"""
+        logger.info(f"Sensor Response: {response}")
+        message = response.message.lower()
         
-        finger_id = response['id']
-        
-        logger.info(finger_id)
-        
-        if not finger_id == 0:
-            name = self.pending_enrollment_name  or "jonh"
-
-            if not name:
-                logger.warning("No name was stored during enrollment")
-                self.enrollment_status_label.setText("Enrollment failed: Name missing")
-                return
-
-            logger.info(f"Attempting to store fingerprint: ID={finger_id}, Name={name}")
-
-            if self.db_manager.enroll_fingerprint(finger_id, name):
-                success_msg = f"Fingerprint stored in MySQL: ID={finger_id}, Name={name}"
-                logger.success(success_msg)  
-                self.enrollment_status_label.setText(success_msg)  
-                self.status_bar.showMessage(success_msg, 5000)  
-                QMessageBox.information(self, "Success", success_msg)  
-                self.refresh_fingerprints()
-            else:
-                error_msg = "Database error during enrollment"
-                logger.error(error_msg)
-                self.enrollment_status_label.setText(error_msg)
-                self.status_bar.showMessage(error_msg, 5000)
-
-            self.pending_enrollment_name = None 
-                
-        if 'template' in response['message'].lower():
-            self.template_count_label.setText(str(response['id']))
-        elif 'Y' == response['type']:
-            logger.info("Handling successful verification response")
-            self.handle_verification_response(response)
-            
-            if 'Y' == response['type']:
-                logger.info("Handling successful enrollment response")
-                self.handle_enrollment_response(response)
-                
-                logger.info('here')
-                """Handle successful enrollment response and save to MySQL DB"""
-                finger_id = response['id']
-                name = "name"
-
-                if not name:
-                    logger.warning("No name was stored during enrollment")
-                    self.enrollment_status_label.setText("Enrollment failed: Name missing")
-                    return
-
-                logger.info(f"Attempting to store fingerprint: ID={finger_id}, Name={name}")
-
-                if self.db_manager.enroll_fingerprint(finger_id, name):
-                    success_msg = f"Fingerprint stored in MySQL: ID={finger_id}, Name={name}"
-                    logger.success(success_msg)  
-                    self.enrollment_status_label.setText(success_msg)  
-                    self.status_bar.showMessage(success_msg, 5000)  
-                    QMessageBox.information(self, "Success", success_msg)  
-                    self.refresh_fingerprints()
-                else:
-                    error_msg = "Database error during enrollment"
-                    logger.error(error_msg)
-                    self.enrollment_status_label.setText(error_msg)
-                    self.status_bar.showMessage(error_msg, 5000)
-
-                self.pending_enrollment_name = None 
-            
-        elif 'deleted' in response['message'].lower():
-            logger.info("Handling successful deletion response")
+        if response.type == CMD_READY:
+            return
+        if 'template' in message:
+            self.template_count_label.setText(str(response.id))
+        elif 'delete' in message:
+            logger.info("Handling deletion response")
             self.handle_deletion_response(response)
-        elif response['type'] == CMD_FAILURE:
-            error_msg = f"Sensor Error: {response['message']}"
+        elif 'enrolled' in message:
+            logger.info("Handling successful enrollment response")
+            self.handle_enrollment_response(response)
+        elif 'match' in message:
+            logger.info("Handling verification response")
+            self.handle_verification_response(response)
+        elif response.type == CMD_FAILURE:
+            error_msg = f"Sensor Error: {response.message}"
             logger.error(error_msg)
-            self.status_bar.showMessage(error_msg, 5000)
-
-            if 'verify' in response['message'].lower():
-                self.verification_status_label.setText("Verification Failed")
-                self.verification_status_label.setStyleSheet("color: red")
-                self.db_manager.log_access_denied()
-                self.refresh_logs()
-
+            self._status(error_msg, 5000)
+            
+            if self.pending_enrollment_name:
+                self.enrollment_status_label.setText(f"Enrollment failed: {response.message}")
+                self.pending_enrollment_name = None
+            elif self._pending_deletes:
+                # "Invalid ID" replies do not mention deletion but end the batch too
+                self.handle_deletion_response(response)
         
     def handle_ready_changed(self, ready):
         """Handle sensor ready state changes"""
@@ -744,9 +1425,8 @@ class MainWindow(QMainWindow):
 
     
     def handle_enrollment_response(self, response):
-        logger.info('here')
         """Handle successful enrollment response and save to MySQL DB"""
-        finger_id = response['id']
+        finger_id = response.id
         name = self.pending_enrollment_name 
 
         if not name:
@@ -760,14 +1440,13 @@ class MainWindow(QMainWindow):
             success_msg = f"Fingerprint stored in MySQL: ID={finger_id}, Name={name}"
             logger.success(success_msg)  
             self.enrollment_status_label.setText(success_msg)  
-            self.status_bar.showMessage(success_msg, 5000)  
+            self._status(success_msg, 5000)
             QMessageBox.information(self, "Success", success_msg)  
-            self.refresh_fingerprints()
         else:
             error_msg = "Database error during enrollment"
             logger.error(error_msg)
             self.enrollment_status_label.setText(error_msg)
-            self.status_bar.showMessage(error_msg, 5000)
+            self._status(error_msg, 5000)
 
         self.pending_enrollment_name = None  
 
@@ -779,10 +1458,16 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Not Connected", "Serial connection not established")
             return
             
-        self.verification_status_label.setText("Place finger on sensor...")
-        self.verification_status_label.setStyleSheet("")
+        self.show_verification_status("Place finger on sensor...", 'neutral')
         self.serial_worker.send_command(CMD_VERIFY)
     
+    def show_verification_status(self, text, style):
+        palette, font = self._verification_styles[style]
+        label = self.verification_status_label
+        label.setText(text)
+        label.setPalette(palette)
+        label.setFont(font)
+    
     def quick_verify(self):
         """Quick verification from dashboard"""
         self.tabs.setCurrentIndex(2) 
@@ -790,71 +1475,142 @@ class MainWindow(QMainWindow):
     
     def handle_verification_response(self, response):
         """Handle verification response"""
-        if response['type'] == CMD_SUCCESS:
-            finger_id = response['id']
-            confidence = response['confidence']
+        if response.type == CMD_SUCCESS:
+            finger_id = response.id
+            confidence = response.confidence
             
             result = self.db_manager.verify_fingerprint(finger_id, confidence)
             if result:
-                self.verification_status_label.setText(f"Access Granted: {result['name']}")
-                self.verification_status_label.setStyleSheet("color: green; font-weight: bold;")
+                self.show_verification_status(f"Access Granted: {result['name']}", 'granted')
                 
                 # Update the result display
                 self.verify_id_label.setText(str(result['id']))
                 self.verify_name_label.setText(result['name'])
                 self.verify_confidence_label.setText(str(result['confidence']))
                 self.verify_time_label.setText(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-                
-                # Refresh logs to show the new access
-                self.refresh_logs()
             else:
-                self.verification_status_label.setText("Database error during verification")
-                self.verification_status_label.setStyleSheet("color: red")
+                self.show_verification_status("Database error during verification", 'failed')
         else:
-            self.verification_status_label.setText("Verification failed")
-            self.verification_status_label.setStyleSheet("color: red")
+            self.show_verification_status("Verification Failed", 'failed')
+            self.db_manager.log_access_denied()
     
     def delete_selected_fingerprint(self):
-        """Delete the selected fingerprint"""
-        selected_rows = self.fingerprints_table.selectedIndexes()
-        if not selected_rows:
+        """Delete every selected fingerprint"""
+        selection = self.fingerprints_table.selectionModel()
+        if not selection.hasSelection():
             QMessageBox.warning(self, "No Selection", "Please select a fingerprint to delete")
             return
-            
-        # Get the fingerprint ID from the first column of the selected row
-        row = selected_rows[0].row()
-        finger_id = int(self.fingerprints_table.item(row, 0).text())
-        name = self.fingerprints_table.item(row, 1).text()
-        
-        # Confirm deletion
-        reply = QMessageBox.question(self, "Confirm Deletion", 
-                                     f"Are you sure you want to delete fingerprint ID {finger_id} ({name})?",
-                                     QMessageBox.Yes | QMessageBox.No)
-                                     
-        if reply == QMessageBox.No:
+        if self._pending_deletes or self._delete_job:
+            QMessageBox.warning(self, "Busy", "A deletion is already in progress")
+            return
+        
+        # selectedIndexes() has one entry per selected cell; the table selects
+        # whole rows, so ask for one index per row, in the name column that
+        # carries the ID
+        names = sorted(selection.selectedRows(1), key=lambda index: index.row())
+        finger_ids = [index.data(Qt.UserRole) for index in names]
+        
+        if len(finger_ids) == 1:
+            name = names[0].data()
+            question = f"Are you sure you want to delete fingerprint ID {finger_ids[0]} ({name})?"
+        else:
+            question = f"Are you sure you want to delete {len(finger_ids)} fingerprints?"
+        
+        # Confirm deletion without a nested event loop: serial responses and
+        # timers keep being served while the question is up
+        box = QMessageBox(QMessageBox.Question, "Confirm Deletion", question,
+                          QMessageBox.Yes | QMessageBox.No, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(
+            lambda _: self._on_delete_confirmed(box.standardButton(box.clickedButton()), finger_ids))
+        box.open()
+    
+    def _on_delete_confirmed(self, button, finger_ids):
+        if button != QMessageBox.Yes:
+            return
+        if self._pending_deletes or self._delete_job:
+            QMessageBox.warning(self, "Busy", "A deletion is already in progress")
             return
             
         # First delete from sensor
-        if self.serial_worker and self.serial_worker.isRunning():
-            self.serial_worker.send_command(CMD_DELETE, finger_id)
-        else:
+        if not self.serial_worker or not self.serial_worker.isRunning():
             QMessageBox.warning(self, "Not Connected", "Serial connection not established")
             return
+        
+        self._pending_deletes = set()
+        self._delete_queue = deque(finger_ids)
+        self._deleted_ids = []
+        self._delete_deadline.start()
+        self.send_queued_deletes()
+    
+    def send_queued_deletes(self):
+        """Top the unanswered sensor deletes back up to DELETES_IN_FLIGHT, in one write"""
+        pending, queued = self._pending_deletes, self._delete_queue
+        while queued and len(pending) < DELETES_IN_FLIGHT:
+            finger_id = queued.popleft()
+            pending.add(finger_id)
+            self.serial_worker.send_command(CMD_DELETE, finger_id, hold=True)
+        if not self.serial_worker.flush():
+            self.finish_bulk_delete()
     
     def handle_deletion_response(self, response):
-        """Handle deletion response from the sensor"""
-        if response['type'] == CMD_SUCCESS:
-            finger_id = response['id']
-            
-            # Delete from database
-            if self.db_manager.delete_fingerprint(finger_id):
-                self.status_bar.showMessage(f"Fingerprint ID {finger_id} deleted successfully", 3000)
-                self.refresh_fingerprints()
-                self.refresh_logs()
-            else:
-                self.status_bar.showMessage("Database error during deletion", 3000)
+        """Record one sensor acknowledgement; the database is updated once all
+        of the batch has been answered"""
+        if response.id not in self._pending_deletes:
+            if response.type == CMD_FAILURE and self._pending_deletes:
+                # Such as an out-of-range ID rejected with id 0; the command it
+                # answers will never be acknowledged
+                logger.warning(f"Sensor rejected a delete: {response.message}")
+                self.finish_bulk_delete()
+            return
+        self._pending_deletes.discard(response.id)
+        # Counted from the latest acknowledgement, so long batches are not cut short
+        self._delete_deadline.start()
+        
+        if response.type == CMD_SUCCESS:
+            self._deleted_ids.append(response.id)
+        else:
+            logger.warning(f"Sensor failed to delete fingerprint ID {response.id}")
+        
+        # Refilled once half the window is answered, so each write carries
+        # several deletes rather than one delete and a count query
+        if self._delete_queue and len(self._pending_deletes) <= DELETES_IN_FLIGHT // 2:
+            self.send_queued_deletes()
+        elif not self._pending_deletes:
+            self.finish_bulk_delete()
+    
+    def finish_bulk_delete(self):
+        """Remove every fingerprint the sensor confirmed, in one transaction"""
+        # Anything still unanswered or unsent will never be acknowledged now
+        self._delete_deadline.stop()
+        self._pending_deletes.clear()
+        self._delete_queue.clear()
+        finger_ids, self._deleted_ids = self._deleted_ids, []
+        if not finger_ids:
+            self._status(MSG_DELETE_SENSOR_FAILED, 3000)
+            return
+        
+        job = DbJob(self.db_manager.bulk_delete_fingerprints, finger_ids)
+        job.signals.finished.connect(functools.partial(self._bulk_delete_done, finger_ids),
+                                     Qt.QueuedConnection)
+        # Held until the result arrives so the signal object stays alive
+        self._delete_job = job
+        self.db_pool.start(job)
+    
+    def _bulk_delete_done(self, finger_ids, deleted):
+        self._delete_job = None
+        if deleted is None:
+            self._status(MSG_DELETE_DB_ERROR, 3000)
+            return
+        
+        deleted = set(finger_ids)
+        self.fp_cache = [row for row in self.fp_cache if row[0] not in deleted]
+        self.fp_rev += 1
+        self.remove_fingerprint_rows(finger_ids)
+        if len(finger_ids) == 1:
+            self._status(MSG_DELETE_OK.format(finger_ids[0]), 3000)
         else:
-            self.status_bar.showMessage("Failed to delete fingerprint from sensor", 3000)
+            self._status(MSG_DELETE_OK_MANY.format(len(finger_ids)), 3000)
     
     def get_template_count(self):
         """Get the number of templates stored in the sensor"""
@@ -863,31 +1619,57 @@ class MainWindow(QMainWindow):
             return
             
         self.serial_worker.send_command(CMD_COUNT)
-        self.status_bar.showMessage("Querying template count...", 2000)
+        self._status("Querying template count...", 2000)
     
     def closeEvent(self, event):
         """Clean up resources when closing the application"""
-        if self.serial_worker and self.serial_worker.isRunning():
-            self.serial_worker.stop()
-            self.serial_worker.wait()
+        # The serial thread winds down while the database is closed here; it
+        # is only waited for at the end
+        serial_worker = self.serial_worker
+        if serial_worker and serial_worker.isRunning():
+            serial_worker.request_stop()
+        else:
+            serial_worker = None
         
+        # Let a running delete commit before its connection pool goes away
+        self.db_pool.waitForDone()
         if self.db_manager:
             self.db_manager.close()
+        
+        self.dbCloseRequested.emit()
+        self.db_thread.quit()
+        self.db_thread.wait()
+        
+        if serial_worker and not serial_worker.wait(2000):
+            # Qt aborts the process if a running QThread is destroyed, so the
+            # window must not go before the worker does
+            logger.warning("Serial worker still busy after 2 s, waiting for it to stop")
+            serial_worker.wait()
             
         event.accept()
 
 
 def main():
-    logger.add("fingerprint_system.log", rotation="10 MB", level="INFO")
+    # enqueue: records are written by loguru's own thread, so handlers on the
+    # GUI thread never wait on the disk
+    logger.add("fingerprint_system.log", rotation="10 MB", compression="gz", level="INFO",
+               enqueue=True, backtrace=False, diagnose=False)
     
+    # Application-wide, so it must be set before the QApplication exists
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     app = QApplication(sys.argv)
-    app.setStyle('Fusion')  
-    
+    app.setStyle('Fusion')
+    # Each of these animations runs its own timer, competing with serial bursts
+    for effect in (Qt.UI_AnimateMenu, Qt.UI_AnimateCombo, Qt.UI_AnimateTooltip, Qt.UI_AnimateToolBox):
+        app.setEffectEnabled(effect, False)
     
     window = MainWindow()
     window.show()
     
-    sys.exit(app.exec_())
+    status = app.exec_()
+    # Drain the log queue before the interpreter exits
+    logger.complete()
+    sys.exit(status)
 
 
 if __name__ == "__main__":
@@ -96,7 +96,9 @@ void loop() {
         break;
     }
 
-    while(Serial.available()) Serial.read();
+    // Only skip line endings: the host ends every command with a newline and
+    // may batch several into one write, so the next one may already be waiting
+    while (Serial.peek() == '\n' || Serial.peek() == '\r' || Serial.peek() == ' ') Serial.read();
     
     sendSerialResponse(CMD_READY, 0, 0, "Ready for next command");
   }